@@ -5,7 +5,7 @@ Covers 10+ API checks based on the published API list:
 https://automationexercise.com/api_list
 
 Run:
-  python src/api_test_runner.py
+  python src/api_test_runner.py [--workers N] [--repeat N]
 
 This script:
 - Creates a unique test user (createAccount)
@@ -20,22 +20,52 @@ This script:
 
 from __future__ import annotations
 
+import argparse
+import functools
 import json
 import os
+import socket
+import ssl
+import statistics
 import sys
+import threading
 import time
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
 
 
 BASE_URL = "https://automationexercise.com"
 API = f"{BASE_URL}/api"
 
+# Endpoint URLs, built once
+EP_PRODUCTS_LIST = f"{API}/productsList"
+EP_BRANDS_LIST = f"{API}/brandsList"
+EP_SEARCH = f"{API}/searchProduct"
+EP_CREATE = f"{API}/createAccount"
+EP_VERIFY = f"{API}/verifyLogin"
+EP_USER_DETAIL = f"{API}/getUserDetailByEmail"
+EP_UPDATE = f"{API}/updateAccount"
+EP_DELETE = f"{API}/deleteAccount"
+
 TIMEOUT = 20
+# Error bodies are tiny; asking for them uncompressed skips the gzip inflate
+NO_COMPRESSION = {"Accept-Encoding": "identity"}
+MAX_WORKERS = 8
+# Connections beyond the worker pool: the lifecycle thread plus the verifyLogin burst
+EXTRA_CONNECTIONS = 4
+
+# Shared by the worker threads: guards the results list and the log file
+_lock = threading.Lock()
 
 
 @dataclass
@@ -43,41 +73,139 @@ class TestResult:
     name: str
     passed: bool
     details: str = ""
+    duration_ms: float = 0.0
+    run: int = 1
 
 
 def log(msg: str, fp):
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Plain field formatting; avoids strftime's locale-aware path on every line
+    t = time.localtime()
+    ts = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
     line = f"[{ts}] {msg}"
-    print(line)
-    fp.write(line + "\n")
-    fp.flush()
+    with _lock:
+        print(line)
+        fp.write(line + "\n")
 
 
-def assert_true(condition: bool, ok: str, fail: str) -> (bool, str):
-    return (True, ok) if condition else (False, fail)
+def check_all(checks) -> tuple[bool, str]:
+    """Run (predicate, ok, fail) checks in order; fail is only formatted for the first failing check."""
+    for pred, _, fail in checks:
+        if not pred():
+            return False, fail()
+    return True, "; ".join(ok for _, ok, _ in checks)
 
 
 def safe_json(resp: requests.Response) -> Dict[str, Any]:
+    # orjson parses the raw bytes directly, skipping requests' charset detection
     try:
-        return resp.json()
-    except Exception:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
         return {"_raw": resp.text}
 
 
-def run_test(results: list[TestResult], name: str, fn, fp):
+def warm_dns(host: str, port: int = 443) -> str:
+    """Memoize getaddrinfo for the run and resolve host once up front."""
+    # Wrap only once, so repeated main() calls don't stack caches
+    if not hasattr(socket.getaddrinfo, "cache_info"):
+        socket.getaddrinfo = functools.lru_cache(maxsize=32)(socket.getaddrinfo)
+    try:
+        # Same arguments urllib3 passes, so its lookups hit this cache entry
+        infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+    except OSError as e:
+        return f"DNS warm-up failed for {host}: {e}"
+    return f"Resolved {host} -> {infos[0][4][0]}"
+
+
+class SharedTLSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections all verify against one SSLContext built up front."""
+
+    def __init__(self, *args, **kwargs):
+        # Set before super().__init__, which calls init_poolmanager
+        self._ssl_context = ssl.create_default_context(cafile=requests.certs.where())
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True:
+            # The shared context already holds the CA bundle; don't reload it per connection
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+def make_session(pool_maxsize: int = MAX_WORKERS + EXTRA_CONNECTIONS) -> requests.Session:
+    """One keep-alive session for the whole run, shared by every test."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": "BTEC-API-Tests/1.0"})
+    # Single host, so one pool sized for every thread that can be in flight.
+    # Only GETs are retried on gateway errors: repeating a POST/PUT/DELETE could act twice
+    # on the account (e.g. "Email already exists") and would hide flakiness the run should report
+    retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                  allowed_methods=frozenset(["GET"]))
+    adapter = SharedTLSAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=True, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+def run_test(results: list[TestResult], name: str, fn, fp, run: int = 1, runs: int = 1):
+    # The run number is its own result field; it only goes into the text log label
+    label = f"{name} [run {run}/{runs}]" if runs > 1 else name
+    t0 = time.perf_counter()
     try:
         passed, details = fn()
-        results.append(TestResult(name=name, passed=passed, details=details))
+        duration_ms = (time.perf_counter() - t0) * 1000
+        with _lock:
+            results.append(TestResult(name=name, passed=passed, details=details, duration_ms=duration_ms, run=run))
         status = "PASS" if passed else "FAIL"
-        log(f"{status} - {name} - {details}", fp)
+        log(f"{status} - {label} - {details}", fp)
     except Exception as e:
-        results.append(TestResult(name=name, passed=False, details=str(e)))
-        log(f"FAIL - {name} - Exception: {e}", fp)
-
-
-def main():
+        duration_ms = (time.perf_counter() - t0) * 1000
+        with _lock:
+            results.append(TestResult(name=name, passed=False, details=str(e), duration_ms=duration_ms, run=run))
+        log(f"FAIL - {label} - Exception: {e}", fp)
+
+
+def write_jsonl_report(path: str, results: list[TestResult]):
+    """One JSON object per result, so dashboards can ingest the run without parsing the text log."""
+    with open(path, "wb") as jfp:
+        jfp.write(b"".join(orjson.dumps(asdict(r)) + b"\n" for r in results))
+
+
+def run_stage(results: list[TestResult], stage: list, fp):
+    """Run one lifecycle stage, sending multi-step stages concurrently."""
+    if len(stage) == 1:
+        name, fn = stage[0]
+        run_test(results, name, fn, fp)
+        return
+    # Own small pool so the burst never queues behind the independent/repeat tests
+    with ThreadPoolExecutor(max_workers=len(stage)) as burst:
+        for name, fn in stage:
+            burst.submit(run_test, results, name, fn, fp)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="AutomationExercise API tests")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS,
+                        help=f"threads used for the independent tests (default: {MAX_WORKERS})")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="run the independent tests N times across the pool, as a light load test (default: 1)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return args
+
+
+def main(argv: Optional[list[str]] = None):
+    args = parse_args(argv)
     os.makedirs("reports", exist_ok=True)
-    log_path = os.path.join("reports", f"api_test_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    log_path = os.path.join("reports", f"api_test_log_{stamp}.txt")
+    jsonl_path = os.path.join("reports", f"api_test_result_{stamp}.jsonl")
     results: list[TestResult] = []
 
     # Create a unique user for the run
@@ -104,161 +232,222 @@ def main():
         "mobile_number": "+998900000000",
     }
 
-    with open(log_path, "w", encoding="utf-8") as fp:
+    # Buffered; flushed once at the summary instead of per line
+    with open(log_path, "w", encoding="utf-8", buffering=64 * 1024) as fp:
         log("=== AutomationExercise API Testing (Python) ===", fp)
         log(f"Base URL: {BASE_URL}", fp)
         log(f"Test user: {email}", fp)
+        log(warm_dns(urlsplit(BASE_URL).hostname), fp)
+
+        session = make_session(pool_maxsize=args.workers + EXTRA_CONNECTIONS)
 
-        session = requests.Session()
-        session.headers.update({"User-Agent": "BTEC-API-Tests/1.0"})
+        # The verifyLogin tests share URL, headers and env settings; prepare them once
+        # and only re-encode the form body (and pick up current session cookies) per test
+        verify_login_req = session.prepare_request(
+            requests.Request("POST", EP_VERIFY, data={"email": email, "password": password}))
+        verify_login_settings = session.merge_environment_settings(verify_login_req.url, {}, None, None, None)
+
+        def post_verify_login(form: Dict[str, str]) -> requests.Response:
+            prepped = verify_login_req.copy()
+            # Cookies set by earlier responses post-date the template; send() won't merge them
+            prepped.headers.pop("Cookie", None)
+            prepped.prepare_cookies(session.cookies)
+            prepped.prepare_body(form, None)
+            return session.send(prepped, timeout=TIMEOUT, **verify_login_settings)
 
         def t01_get_products_list():
-            r = session.get(f"{API}/productsList", timeout=TIMEOUT)
+            r = session.get(EP_PRODUCTS_LIST, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code == 200, "200 OK", f"Expected 200, got {r.status_code}")
-            ok2, d2 = assert_true(isinstance(data.get("products"), list), "products[] present", f"products[] missing, keys={list(data.keys())}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code == 200, "200 OK", lambda: f"Expected 200, got {r.status_code}"),
+                (lambda: isinstance(data.get("products"), list), "products[] present",
+                 lambda: f"products[] missing, keys={list(data.keys())}"),
+            ])
 
         def t02_products_list_post_not_supported():
-            r = session.post(f"{API}/productsList", timeout=TIMEOUT)
+            r = session.post(EP_PRODUCTS_LIST, headers=NO_COMPRESSION, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code in (405, 200), f"Status {r.status_code}", f"Unexpected status {r.status_code}")
-            # API list states 405 for POST
-            ok2, d2 = assert_true(data.get("responseCode") == 405 or "not supported" in str(data).lower(),
-                                  "405 not supported", f"Expected not supported, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code in (405, 200), f"Status {r.status_code}", lambda: f"Unexpected status {r.status_code}"),
+                # API list states 405 for POST
+                (lambda: data.get("responseCode") == 405 or "not supported" in str(data).lower(),
+                 "405 not supported", lambda: f"Expected not supported, got {data}"),
+            ])
 
         def t03_get_brands_list():
-            r = session.get(f"{API}/brandsList", timeout=TIMEOUT)
+            r = session.get(EP_BRANDS_LIST, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code == 200, "200 OK", f"Expected 200, got {r.status_code}")
-            ok2, d2 = assert_true(isinstance(data.get("brands"), list), "brands[] present", f"brands[] missing, keys={list(data.keys())}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code == 200, "200 OK", lambda: f"Expected 200, got {r.status_code}"),
+                (lambda: isinstance(data.get("brands"), list), "brands[] present",
+                 lambda: f"brands[] missing, keys={list(data.keys())}"),
+            ])
 
         def t04_brands_list_put_not_supported():
-            r = session.put(f"{API}/brandsList", timeout=TIMEOUT)
+            r = session.put(EP_BRANDS_LIST, headers=NO_COMPRESSION, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code in (405, 200), f"Status {r.status_code}", f"Unexpected status {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") == 405 or "not supported" in str(data).lower(),
-                                  "405 not supported", f"Expected not supported, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code in (405, 200), f"Status {r.status_code}", lambda: f"Unexpected status {r.status_code}"),
+                (lambda: data.get("responseCode") == 405 or "not supported" in str(data).lower(),
+                 "405 not supported", lambda: f"Expected not supported, got {data}"),
+            ])
 
         def t05_search_product_valid():
-            r = session.post(f"{API}/searchProduct", data={"search_product": "top"}, timeout=TIMEOUT)
+            r = session.post(EP_SEARCH, data={"search_product": "top"}, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code == 200, "200 OK", f"Expected 200, got {r.status_code}")
-            ok2, d2 = assert_true(isinstance(data.get("products"), list), "products[] present", f"products[] missing, keys={list(data.keys())}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code == 200, "200 OK", lambda: f"Expected 200, got {r.status_code}"),
+                (lambda: isinstance(data.get("products"), list), "products[] present",
+                 lambda: f"products[] missing, keys={list(data.keys())}"),
+            ])
 
         def t06_search_product_missing_param():
-            r = session.post(f"{API}/searchProduct", data={}, timeout=TIMEOUT)
+            r = session.post(EP_SEARCH, data={}, timeout=TIMEOUT)
             data = safe_json(r)
             # API list expects 400 responseCode
-            ok1, d1 = assert_true(r.status_code in (200, 400), f"HTTP {r.status_code}", f"Unexpected http {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") == 400 or "missing" in str(data).lower(),
-                                  "400 missing param", f"Expected missing param error, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code in (200, 400), f"HTTP {r.status_code}", lambda: f"Unexpected http {r.status_code}"),
+                (lambda: data.get("responseCode") == 400 or "missing" in str(data).lower(),
+                 "400 missing param", lambda: f"Expected missing param error, got {data}"),
+            ])
 
         def t07_create_account():
-            r = session.post(f"{API}/createAccount", data=user_payload, timeout=TIMEOUT)
+            r = session.post(EP_CREATE, data=user_payload, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code in (201, 200), f"HTTP {r.status_code}", f"Expected 201/200, got {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") in (201, 200) or "created" in str(data).lower(),
-                                  "User created", f"Expected created, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code in (201, 200), f"HTTP {r.status_code}", lambda: f"Expected 201/200, got {r.status_code}"),
+                (lambda: data.get("responseCode") in (201, 200) or "created" in str(data).lower(),
+                 "User created", lambda: f"Expected created, got {data}"),
+            ])
 
         def t08_verify_login_valid():
-            r = session.post(f"{API}/verifyLogin", data={"email": email, "password": password}, timeout=TIMEOUT)
+            r = post_verify_login({"email": email, "password": password})
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code == 200, "200 OK", f"Expected 200, got {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") == 200 or "exists" in str(data).lower(),
-                                  "User exists", f"Expected user exists, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code == 200, "200 OK", lambda: f"Expected 200, got {r.status_code}"),
+                (lambda: data.get("responseCode") == 200 or "exists" in str(data).lower(),
+                 "User exists", lambda: f"Expected user exists, got {data}"),
+            ])
 
         def t09_verify_login_invalid():
-            r = session.post(f"{API}/verifyLogin", data={"email": email, "password": "wrong_password"}, timeout=TIMEOUT)
+            r = post_verify_login({"email": email, "password": "wrong_password"})
             data = safe_json(r)
             # API list expects responseCode 404
-            ok1, d1 = assert_true(r.status_code in (200, 404), f"HTTP {r.status_code}", f"Unexpected http {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") == 404 or "not found" in str(data).lower(),
-                                  "User not found", f"Expected user not found, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code in (200, 404), f"HTTP {r.status_code}", lambda: f"Unexpected http {r.status_code}"),
+                (lambda: data.get("responseCode") == 404 or "not found" in str(data).lower(),
+                 "User not found", lambda: f"Expected user not found, got {data}"),
+            ])
 
         def t10_verify_login_missing_email():
-            r = session.post(f"{API}/verifyLogin", data={"password": password}, timeout=TIMEOUT)
+            r = post_verify_login({"password": password})
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code in (200, 400), f"HTTP {r.status_code}", f"Unexpected http {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") == 400 or "missing" in str(data).lower(),
-                                  "400 missing param", f"Expected missing param error, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code in (200, 400), f"HTTP {r.status_code}", lambda: f"Unexpected http {r.status_code}"),
+                (lambda: data.get("responseCode") == 400 or "missing" in str(data).lower(),
+                 "400 missing param", lambda: f"Expected missing param error, got {data}"),
+            ])
 
         def t11_verify_login_delete_not_supported():
-            r = session.delete(f"{API}/verifyLogin", timeout=TIMEOUT)
+            r = session.delete(EP_VERIFY, headers=NO_COMPRESSION, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code in (200, 405), f"HTTP {r.status_code}", f"Unexpected http {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") == 405 or "not supported" in str(data).lower(),
-                                  "405 not supported", f"Expected not supported, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code in (200, 405), f"HTTP {r.status_code}", lambda: f"Unexpected http {r.status_code}"),
+                (lambda: data.get("responseCode") == 405 or "not supported" in str(data).lower(),
+                 "405 not supported", lambda: f"Expected not supported, got {data}"),
+            ])
 
         def t12_get_user_detail_by_email():
-            r = session.get(f"{API}/getUserDetailByEmail", params={"email": email}, timeout=TIMEOUT)
+            r = session.get(EP_USER_DETAIL, params={"email": email}, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code == 200, "200 OK", f"Expected 200, got {r.status_code}")
-            # Response has user details JSON; structure may vary. We'll check responseCode and user
-            ok2, d2 = assert_true(data.get("responseCode") == 200 or "user" in data or "email" in str(data).lower(),
-                                  "User detail present", f"Expected user detail, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code == 200, "200 OK", lambda: f"Expected 200, got {r.status_code}"),
+                # Response has user details JSON; structure may vary. We'll check responseCode and user
+                (lambda: data.get("responseCode") == 200 or "user" in data or "email" in str(data).lower(),
+                 "User detail present", lambda: f"Expected user detail, got {data}"),
+            ])
 
         def t13_update_account_put():
             # Update a field to prove PUT works
-            updated = dict(user_payload)
-            updated["company"] = "BTEC_UPDATED"
-            r = session.put(f"{API}/updateAccount", data=updated, timeout=TIMEOUT)
+            updated = {**user_payload, "company": "BTEC_UPDATED"}
+            r = session.put(EP_UPDATE, data=updated, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code in (200, 201), f"HTTP {r.status_code}", f"Expected 200, got {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") == 200 or "updated" in str(data).lower(),
-                                  "User updated", f"Expected updated, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code in (200, 201), f"HTTP {r.status_code}", lambda: f"Expected 200, got {r.status_code}"),
+                (lambda: data.get("responseCode") == 200 or "updated" in str(data).lower(),
+                 "User updated", lambda: f"Expected updated, got {data}"),
+            ])
 
         def cleanup_delete_account():
-            r = session.delete(f"{API}/deleteAccount", data={"email": email, "password": password}, timeout=TIMEOUT)
+            r = session.delete(EP_DELETE, data={"email": email, "password": password}, timeout=TIMEOUT)
             data = safe_json(r)
-            ok1, d1 = assert_true(r.status_code == 200, "200 OK", f"Expected 200, got {r.status_code}")
-            ok2, d2 = assert_true(data.get("responseCode") == 200 or "deleted" in str(data).lower(),
-                                  "Account deleted", f"Expected deleted, got {data}")
-            return (ok1 and ok2, f"{d1}; {d2}")
+            return check_all([
+                (lambda: r.status_code == 200, "200 OK", lambda: f"Expected 200, got {r.status_code}"),
+                (lambda: data.get("responseCode") == 200 or "deleted" in str(data).lower(),
+                 "Account deleted", lambda: f"Expected deleted, got {data}"),
+            ])
+
+        # Independent tests: no shared state, safe to run concurrently on the session
+        independent = [
+            ("API 1 - GET /api/productsList returns products", t01_get_products_list),
+            ("API 2 - POST /api/productsList not supported (negative)", t02_products_list_post_not_supported),
+            ("API 3 - GET /api/brandsList returns brands", t03_get_brands_list),
+            ("API 4 - PUT /api/brandsList not supported (negative)", t04_brands_list_put_not_supported),
+            ("API 5 - POST /api/searchProduct with parameter returns results", t05_search_product_valid),
+            ("API 6 - POST /api/searchProduct without parameter returns error (negative)", t06_search_product_missing_param),
+            ("API 9 - DELETE /api/verifyLogin not supported (negative)", t11_verify_login_delete_not_supported),
+        ]
+        # User lifecycle: stages run in order, since each depends on the account created
+        # by the first; steps inside one stage are independent of each other
+        lifecycle = [
+            [("API 11 - POST /api/createAccount creates user", t07_create_account)],
+            # verifyLogin checks only read the account, so they go out as one burst
+            [("API 7 - POST /api/verifyLogin valid credentials", t08_verify_login_valid),
+             ("API 10 - POST /api/verifyLogin invalid credentials (negative)", t09_verify_login_invalid),
+             ("API 8 - POST /api/verifyLogin missing email (negative)", t10_verify_login_missing_email)],
+            [("API 14 - GET /api/getUserDetailByEmail returns details", t12_get_user_detail_by_email)],
+            [("API 13 - PUT /api/updateAccount updates user", t13_update_account_put)],
+            # Cleanup
+            [("API 12 - DELETE /api/deleteAccount deletes user (cleanup)", cleanup_delete_account)],
+        ]
 
         # Execute tests
-        run_test(results, "API 1 - GET /api/productsList returns products", t01_get_products_list, fp)
-        run_test(results, "API 2 - POST /api/productsList not supported (negative)", t02_products_list_post_not_supported, fp)
-        run_test(results, "API 3 - GET /api/brandsList returns brands", t03_get_brands_list, fp)
-        run_test(results, "API 4 - PUT /api/brandsList not supported (negative)", t04_brands_list_put_not_supported, fp)
-        run_test(results, "API 5 - POST /api/searchProduct with parameter returns results", t05_search_product_valid, fp)
-        run_test(results, "API 6 - POST /api/searchProduct without parameter returns error (negative)", t06_search_product_missing_param, fp)
-
-        run_test(results, "API 11 - POST /api/createAccount creates user", t07_create_account, fp)
-        run_test(results, "API 7 - POST /api/verifyLogin valid credentials", t08_verify_login_valid, fp)
-        run_test(results, "API 10 - POST /api/verifyLogin invalid credentials (negative)", t09_verify_login_invalid, fp)
-        run_test(results, "API 8 - POST /api/verifyLogin missing email (negative)", t10_verify_login_missing_email, fp)
-        run_test(results, "API 9 - DELETE /api/verifyLogin not supported (negative)", t11_verify_login_delete_not_supported, fp)
-        run_test(results, "API 14 - GET /api/getUserDetailByEmail returns details", t12_get_user_detail_by_email, fp)
-        run_test(results, "API 13 - PUT /api/updateAccount updates user", t13_update_account_put, fp)
-
-        # Cleanup
-        run_test(results, "API 12 - DELETE /api/deleteAccount deletes user (cleanup)", cleanup_delete_account, fp)
+        with session, ThreadPoolExecutor(max_workers=args.workers) as pool:
+            for rep in range(args.repeat):
+                for name, fn in independent:
+                    pool.submit(run_test, results, name, fn, fp, rep + 1, args.repeat)
+
+            # Walk the lifecycle chain on this thread while the pool drains,
+            # so wall time is roughly max(chain, slowest independent test)
+            for stage in lifecycle:
+                run_stage(results, stage, fp)
 
         # Summary
         passed = sum(1 for r in results if r.passed)
         total = len(results)
         log("=== SUMMARY ===", fp)
         log(f"Total: {total} | Passed: {passed} | Failed: {total - passed}", fp)
+        if args.repeat > 1:
+            # Percentiles per test across its repeats; mixing endpoints would mean nothing
+            durations: Dict[str, list[float]] = {}
+            for r in results:
+                durations.setdefault(r.name, []).append(r.duration_ms)
+            for name, ms in durations.items():
+                if len(ms) > 1:
+                    p95 = statistics.quantiles(ms, n=20, method="inclusive")[18]
+                    log(f"Latency - {name} - p50 {statistics.median(ms):.0f} ms | p95 {p95:.0f} ms (n={len(ms)})", fp)
+        write_jsonl_report(jsonl_path, results)
+        log(f"JSON report: {jsonl_path}", fp)
+        fp.flush()
 
         # Non-zero exit code if any failed (useful for CI / easy grading)
         if passed != total:
             log("Some tests failed. Check details above.", fp)
+            fp.flush()
             sys.exit(1)
 
         log("All tests passed ✅", fp)
+        fp.flush()
         sys.exit(0)
 
 